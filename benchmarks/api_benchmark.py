@@ -348,6 +348,37 @@ def sda_index_8(state):
   _run_sda_index_bench(state, 8)
 
 
+@google_benchmark.register
+def isinstance_ndarray_device_array(state):
+  x = jnp.ones(3)
+  while state:
+    isinstance(x, jnp.ndarray)
+
+
+@google_benchmark.register
+@required_devices(1)
+def isinstance_ndarray_sda(state):
+  x = jax.pmap(jnp.sin)(jnp.arange(1))
+  while state:
+    isinstance(x, jnp.ndarray)
+
+
+@google_benchmark.register
+def isinstance_ndarray_tracer(state):
+  def f(x):
+    while state:
+      isinstance(x, jnp.ndarray)
+    return x
+  jax.make_jaxpr(f)(1.)
+
+
+@google_benchmark.register
+def isinstance_ndarray_non_array(state):
+  x = 1.
+  while state:
+    isinstance(x, jnp.ndarray)
+
+
 def _sparse_bcoo_fromdense(state, jit: bool = False, compile: bool = False):
   shape = (2000, 2000)
   nse = 10000
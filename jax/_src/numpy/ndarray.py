@@ -12,262 +12,182 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import abc
-from typing import Any, Tuple, Optional, Union
+from typing import Any
 
 from jax import core
 from jax.interpreters import pxla
 from jax._src import device_array
-import numpy as np
 
 
-class ArrayMeta(abc.ABCMeta):
-  """Metaclass for overriding ndarray isinstance checks."""
-
-  def __instancecheck__(self, instance):
+def _all_subclasses(cls):
+  subclasses = {cls}
+  for sub in cls.__subclasses__():
+    subclasses |= _all_subclasses(sub)
+  return subclasses
+
+# Aval types known when this module is loaded. Subclasses of UnshapedArray
+# defined later are still handled by the isinstance fallback below.
+_UNSHAPED_AVAL_TYPES = frozenset(_all_subclasses(core.UnshapedArray))
+
+_SENTINEL = object()
+
+# Methods and properties that registered array types are expected to provide.
+# ndarray's own at, aval and weak_type are only placeholders that raise, so
+# they are listed too. Their signatures live in ndarray.pyi.
+_ABSTRACT_METHODS = frozenset([
+    "__getitem__", "__setitem__", "__len__", "__iter__", "__reversed__",
+    "__lt__", "__le__", "__eq__", "__ne__", "__gt__", "__ge__", "__neg__",
+    "__pos__", "__abs__", "__invert__", "__add__", "__sub__", "__mul__",
+    "__matmul__", "__truediv__", "__floordiv__", "__mod__", "__divmod__",
+    "__pow__", "__lshift__", "__rshift__", "__and__", "__xor__", "__or__",
+    "__radd__", "__rsub__", "__rmul__", "__rmatmul__", "__rtruediv__",
+    "__rfloordiv__", "__rmod__", "__rdivmod__", "__rpow__", "__rlshift__",
+    "__rrshift__", "__rand__", "__rxor__", "__ror__", "__bool__",
+    "__complex__", "__int__", "__float__", "__round__", "__index__", "all",
+    "any", "argmax", "argmin", "argpartition", "argsort", "astype", "choose",
+    "clip", "compress", "conj", "conjugate", "copy", "cumprod", "cumsum",
+    "diagonal", "dot", "flatten", "imag", "item", "max", "mean", "min",
+    "nbytes", "nonzero", "prod", "ptp", "ravel", "real", "repeat", "reshape",
+    "round", "searchsorted", "sort", "squeeze", "std", "sum", "swapaxes",
+    "take", "tobytes", "tolist", "trace", "transpose", "var", "view",
+    "at", "aval", "weak_type",
+])
+
+
+class _UnimplementedAttributeError(AttributeError, NotImplementedError):
+  pass
+
+
+class _Unimplemented:
+  """Placeholder for an ndarray attribute that array types must provide.
+
+  Accessing it on an instance raises an AttributeError, so that getattr() with
+  a default and hasattr() keep working. The docstring passed in is what the
+  documentation shows for the attribute.
+  """
+
+  def __init__(self, name, doc):
+    self.name = name
+    self.__doc__ = doc
+
+  def __get__(self, instance, owner=None):
+    if instance is None:
+      return self
+    raise _UnimplementedAttributeError(
+        f"{type(instance).__name__} does not implement ndarray.{self.name}")
+
+
+class ArrayMeta(type):
+  """Metaclass for overriding ndarray isinstance checks.
+
+  Registration of virtual subclasses works like ``abc.ABCMeta.register``, but
+  without the ABC registry and negative caches, since the classes using this
+  metaclass are never subclassed concretely.
+
+  A class can be frozen with ``_freeze()``, after which its attributes can no
+  longer be set or deleted, so that nothing bumps its type version (and
+  invalidates CPython's attribute caches). ``ndarray`` is frozen once the
+  array types at the bottom of this module are registered.
+  """
+
+  def __new__(mcs, name, bases, namespace, **kwargs):
+    cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+    type.__setattr__(cls, "_registered_types", frozenset())
+    type.__setattr__(cls, "_registered_bases", ())
+    return cls
+
+  def register(cls, subclass):
+    """Registers ``subclass`` as a virtual subclass and returns it.
+
+    Raises TypeError once the class is frozen; for ``ndarray`` that is as soon
+    as ``jax.numpy`` has been imported.
+    """
+    cls.register_many([subclass])
+    return subclass
+
+  def register_many(cls, subclasses):
+    """Registers each of ``subclasses`` as a virtual subclass.
+
+    Raises TypeError once the class is frozen; for ``ndarray`` that is as soon
+    as ``jax.numpy`` has been imported.
+    """
+    if vars(cls).get("_frozen", False):
+      raise TypeError(f"{cls.__name__} is read-only; virtual subclasses can "
+                      "no longer be registered")
+    subclasses = frozenset(subclasses)
+    if not all(isinstance(t, type) for t in subclasses):
+      raise TypeError("Can only register classes")
+    cls._registered_types = cls._registered_types | subclasses
+    # Tuple form for issubclass/isinstance, which loop over a tuple in C.
+    cls._registered_bases = tuple(cls._registered_types)
+
+  def _freeze(cls):
+    type.__setattr__(cls, "_frozen", True)
+
+  def __setattr__(cls, name, value):
+    if vars(cls).get("_frozen", False):
+      raise TypeError(f"{cls.__name__} is read-only; cannot set attribute "
+                      f"{name!r}")
+    super().__setattr__(name, value)
+
+  def __delattr__(cls, name):
+    if vars(cls).get("_frozen", False):
+      raise TypeError(f"{cls.__name__} is read-only; cannot delete attribute "
+                      f"{name!r}")
+    super().__delattr__(name)
+
+  def __subclasscheck__(cls, subclass):
+    return (type.__subclasscheck__(cls, subclass) or
+            issubclass(subclass, cls._registered_bases))
+
+  # The default arguments bind everything the hot path needs as locals, so
+  # each call does no global or builtin lookups.
+  def __instancecheck__(self, instance, _UnshapedArray=core.UnshapedArray,
+                        _unshaped_aval_types=_UNSHAPED_AVAL_TYPES,
+                        _sentinel=_SENTINEL, _type=type, _getattr=getattr,
+                        _isinstance=isinstance):
+    # Registered array types (DeviceArray and friends) make up the bulk of the
+    # inputs, so check for them first with a single set lookup.
+    if _type(instance) in self._registered_types:
+      return True
     # Allow tracer instances with avals that are instances of UnshapedArray.
     # We could instead just declare Tracer an instance of the ndarray type, but
     # there can be traced values that are not arrays. The main downside here is
     # that isinstance(x, ndarray) might return true but
     # issubclass(type(x), ndarray) might return false for an array tracer.
-    try:
-      return (hasattr(instance, "aval") and
-              isinstance(instance.aval, core.UnshapedArray))
-    except AttributeError:
-      super().__instancecheck__(instance)
-
-
+    # For the same reason we can't answer from type(instance) for tracers: the
+    # same Tracer subclass can carry, e.g., an AbstractToken aval.
+    aval = _getattr(instance, "aval", _sentinel)
+    if aval is _sentinel:
+      # No aval: fall back to the same rules as issubclass(type(x), ndarray).
+      return (_type.__instancecheck__(self, instance) or
+              _isinstance(instance, self._registered_bases))
+    return (_type(aval) in _unshaped_aval_types or
+            _isinstance(aval, _UnshapedArray))
+
+
+# Only what the runtime needs is declared here; type checkers see the full
+# ndarray interface, including dtype, shape and friends, in ndarray.pyi.
 class ndarray(metaclass=ArrayMeta):
-  dtype: np.dtype
-  ndim: int
-  shape: Tuple[int, ...]
-  size: int
+  # Keep concrete subclasses free of a forced __dict__/__weakref__. The
+  # registered array types declare their own layout; see the __slots__ of
+  # device_array._DeviceArray.
+  __slots__ = ()
 
   def __init__(self, shape, dtype=None, buffer=None, offset=0, strides=None,
                order=None):
     raise TypeError("jax.numpy.ndarray() should not be instantiated explicitly."
                     " Use jax.numpy.array, or jax.numpy.zeros instead.")
 
-  @abc.abstractmethod
-  def __getitem__(self, key, indices_are_sorted=False,
-                  unique_indices=False) -> Any: ...
-  @abc.abstractmethod
-  def __setitem__(self, key, value) -> Any: ...
-  @abc.abstractmethod
-  def __len__(self) -> Any: ...
-  @abc.abstractmethod
-  def __iter__(self) -> Any: ...
-  @abc.abstractmethod
-  def __reversed__(self) -> Any: ...
-
-  # Comparisons
-  @abc.abstractmethod
-  def __lt__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __le__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __eq__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __ne__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __gt__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __ge__(self, other) -> Any: ...
-
-  # Unary arithmetic
-
-  @abc.abstractmethod
-  def __neg__(self) -> Any: ...
-  @abc.abstractmethod
-  def __pos__(self) -> Any: ...
-  @abc.abstractmethod
-  def __abs__(self) -> Any: ...
-  @abc.abstractmethod
-  def __invert__(self) -> Any: ...
-
-  # Binary arithmetic
-
-  @abc.abstractmethod
-  def __add__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __sub__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __mul__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __matmul__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __truediv__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __floordiv__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __mod__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __divmod__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __pow__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __lshift__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rshift__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __and__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __xor__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __or__(self, other) -> Any: ...
-
-  @abc.abstractmethod
-  def __radd__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rsub__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rmul__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rmatmul__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rtruediv__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rfloordiv__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rmod__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rdivmod__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rpow__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rlshift__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rrshift__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rand__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __rxor__(self, other) -> Any: ...
-  @abc.abstractmethod
-  def __ror__(self, other) -> Any: ...
-
-  @abc.abstractmethod
-  def __bool__(self) -> Any: ...
-  @abc.abstractmethod
-  def __complex__(self) -> Any: ...
-  @abc.abstractmethod
-  def __int__(self) -> Any: ...
-  @abc.abstractmethod
-  def __float__(self) -> Any: ...
-  @abc.abstractmethod
-  def __round__(self, ndigits=None) -> Any: ...
-
-  @abc.abstractmethod
-  def __index__(self) -> Any: ...
-
-  # np.ndarray methods:
-  @abc.abstractmethod
-  def all(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, out=None,
-          keepdims=None) -> Any: ...
-  @abc.abstractmethod
-  def any(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, out=None,
-          keepdims=None) -> Any: ...
-  @abc.abstractmethod
-  def argmax(self, axis: Optional[int] = None, out=None, keepdims=None) -> Any: ...
-  @abc.abstractmethod
-  def argmin(self, axis: Optional[int] = None, out=None, keepdims=None) -> Any: ...
-  @abc.abstractmethod
-  def argpartition(self, kth, axis=-1, kind='introselect', order=None) -> Any: ...
-  @abc.abstractmethod
-  def argsort(self, axis: Optional[int] = -1, kind='quicksort', order=None) -> Any: ...
-  @abc.abstractmethod
-  def astype(self, dtype) -> Any: ...
-  @abc.abstractmethod
-  def choose(self, choices, out=None, mode='raise') -> Any: ...
-  @abc.abstractmethod
-  def clip(self, a_min=None, a_max=None, out=None) -> Any: ...
-  @abc.abstractmethod
-  def compress(self, condition, axis: Optional[int] = None, out=None) -> Any: ...
-  @abc.abstractmethod
-  def conj(self) -> Any: ...
-  @abc.abstractmethod
-  def conjugate(self) -> Any: ...
-  @abc.abstractmethod
-  def copy(self) -> Any: ...
-  @abc.abstractmethod
-  def cumprod(self, axis: Optional[Union[int, Tuple[int, ...]]] = None,
-              dtype=None, out=None) -> Any: ...
-  @abc.abstractmethod
-  def cumsum(self, axis: Optional[Union[int, Tuple[int, ...]]] = None,
-             dtype=None, out=None) -> Any: ...
-  @abc.abstractmethod
-  def diagonal(self, offset=0, axis1: int = 0, axis2: int = 1) -> Any: ...
-  @abc.abstractmethod
-  def dot(self, b, *, precision=None) -> Any: ...
-  @abc.abstractmethod
-  def flatten(self) -> Any: ...
-  @property
-  @abc.abstractmethod
-  def imag(self) -> Any: ...
-  @abc.abstractmethod
-  def item(self, *args) -> Any: ...
-  @abc.abstractmethod
-  def max(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, out=None,
-          keepdims=None, initial=None, where=None) -> Any: ...
-  @abc.abstractmethod
-  def mean(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, dtype=None,
-           out=None, keepdims=False, *, where=None,) -> Any: ...
-  @abc.abstractmethod
-  def min(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, out=None,
-          keepdims=None, initial=None, where=None) -> Any: ...
-  @property
-  @abc.abstractmethod
-  def nbytes(self) -> Any: ...
-  @abc.abstractmethod
-  def nonzero(self, *, size=None, fill_value=None) -> Any: ...
-  @abc.abstractmethod
-  def prod(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, dtype=None,
-           out=None, keepdims=None, initial=None, where=None) -> Any: ...
-  @abc.abstractmethod
-  def ptp(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, out=None,
-          keepdims=False,) -> Any: ...
-  @abc.abstractmethod
-  def ravel(self, order='C') -> Any: ...
-  @property
-  @abc.abstractmethod
-  def real(self) -> Any: ...
-  @abc.abstractmethod
-  def repeat(self, repeats, axis: Optional[int] = None, *,
-             total_repeat_length=None) -> Any: ...
-  @abc.abstractmethod
-  def reshape(self, *args, order='C') -> Any: ...
-  @abc.abstractmethod
-  def round(self, decimals=0, out=None) -> Any: ...
-  @abc.abstractmethod
-  def searchsorted(self, v, side='left', sorter=None) -> Any: ...
-  @abc.abstractmethod
-  def sort(self, axis: Optional[int] = -1, kind='quicksort', order=None) -> Any: ...
-  @abc.abstractmethod
-  def squeeze(self, axis: Optional[Union[int, Tuple[int, ...]]] = None) -> Any: ...
-  @abc.abstractmethod
-  def std(self, axis: Optional[Union[int, Tuple[int, ...]]] = None,
-          dtype=None, out=None, ddof=0, keepdims=False, *, where=None) -> Any: ...
-  @abc.abstractmethod
-  def sum(self, axis: Optional[Union[int, Tuple[int, ...]]] = None, dtype=None,
-          out=None, keepdims=None, initial=None, where=None) -> Any: ...
-  @abc.abstractmethod
-  def swapaxes(self, axis1: int, axis2: int) -> Any: ...
-  @abc.abstractmethod
-  def take(self, indices, axis: Optional[int] = None, out=None,
-           mode=None) -> Any: ...
-  @abc.abstractmethod
-  def tobytes(self, order='C') -> Any: ...
-  @abc.abstractmethod
-  def tolist(self) -> Any: ...
-  @abc.abstractmethod
-  def trace(self, offset=0, axis1: int = 0, axis2: int = 1, dtype=None,
-            out=None) -> Any: ...
-  @abc.abstractmethod
-  def transpose(self, *args) -> Any: ...
-  @abc.abstractmethod
-  def var(self, axis: Optional[Union[int, Tuple[int, ...]]] = None,
-          dtype=None, out=None, ddof=0, keepdims=False, *, where=None) -> Any: ...
-  @abc.abstractmethod
-  def view(self, dtype=None, type=None) -> Any: ...
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    if __debug__:
+      # Only count definitions below ndarray: dir() would also see the
+      # comparison methods every class inherits from object.
+      bases = [b for b in cls.__mro__ if b not in (ndarray, object)]
+      missing = {n for n in _ABSTRACT_METHODS
+                 if not any(n in vars(b) for b in bases)}
+      assert not missing, f"{cls.__name__} is missing {sorted(missing)}"
 
   # Even though we don't always support the NumPy array protocol, e.g., for
   # tracer types, for type checking purposes we must declare support so we
@@ -275,18 +195,16 @@ class ndarray(metaclass=ArrayMeta):
   def __array__(self) -> Any: ...
 
   # JAX extensions
-  @property
-  @abc.abstractmethod
-  def at(self) -> Any: ...
-  @property
-  @abc.abstractmethod
-  def aval(self) -> Any: ...
-  @property
-  @abc.abstractmethod
-  def weak_type(self) -> bool: ...
-
-
-ndarray.register(device_array.DeviceArray)
-for t in device_array.device_array_types:
-  ndarray.register(t)
-ndarray.register(pxla._SDA_BASE_CLASS)
+  at = _Unimplemented(
+      "at", "Helper property for index update functionality; see "
+      "``jax._src.numpy.lax_numpy._IndexUpdateHelper`` for the details.")
+  aval = _Unimplemented(
+      "aval", "The abstract value (shape, dtype and weak type) of the array.")
+  weak_type = _Unimplemented(
+      "weak_type", "Whether the dtype of the array is weakly typed.")
+
+
+ndarray.register_many([device_array.DeviceArray,
+                       *device_array.device_array_types,
+                       pxla._SDA_BASE_CLASS])
+ndarray._freeze()
@@ -36,7 +36,7 @@ setup(
     author='JAX team',
     author_email='jax-dev@google.com',
     packages=find_packages(exclude=["examples"]),
-    package_data={'jax': ['py.typed']},
+    package_data={'jax': ['py.typed', '_src/numpy/ndarray.pyi']},
     python_requires='>=3.7',
     install_requires=[
         'absl-py',
@@ -54,6 +54,7 @@ from jax.interpreters import pxla
 from jax.interpreters import partial_eval as pe
 from jax.interpreters.pxla import PartitionSpec as P
 from jax._src import device_array
+from jax._src.numpy import ndarray as ndarray_lib
 import jax._src.lib
 from jax._src.lib import xla_client
 from jax._src import test_util as jtu
@@ -1342,6 +1343,46 @@ class APITest(jtu.JaxTestCase):
     self.assertFalse(issubclass(pxla.ShardedDeviceArray, np.ndarray))
     self.assertFalse(issubclass(pxla._ShardedDeviceArray, np.ndarray))
 
+  def test_ndarray_read_only(self):
+    with self.assertRaisesRegex(
+        TypeError,
+        "ndarray is read-only; virtual subclasses can no longer be registered"):
+      jnp.ndarray.register(int)
+    with self.assertRaisesRegex(TypeError, "ndarray is read-only"):
+      jnp.ndarray.register(1)
+    self.assertFalse(issubclass(int, jnp.ndarray))
+
+  def test_ndarray_register_non_class(self):
+    class A(metaclass=type(jnp.ndarray)):
+      pass
+    with self.assertRaisesRegex(TypeError, "Can only register classes"):
+      A.register(1)
+
+  @unittest.skipIf(not __debug__, "the check uses assert")
+  def test_ndarray_subclass_missing_methods(self):
+    with self.assertRaises(AssertionError) as cm:
+      class C(jnp.ndarray):
+        def __getitem__(self, key): ...
+    msg = str(cm.exception)
+    self.assertIn("C is missing", msg)
+    self.assertIn("'__eq__'", msg)
+    self.assertIn("'aval'", msg)
+    self.assertNotIn("'__getitem__'", msg)
+
+  def test_ndarray_placeholder_attributes(self):
+    ns = dict.fromkeys(ndarray_lib._ABSTRACT_METHODS)
+    # A subclass that passes the completeness check but leaves aval to the
+    # ndarray placeholder.
+    ns["aval"] = vars(jnp.ndarray)["aval"]
+    ns["__init__"] = lambda self: None
+    x = type("C", (jnp.ndarray,), ns)()
+    self.assertFalse(hasattr(x, "aval"))
+    with self.assertRaisesRegex(AttributeError,
+                                "C does not implement ndarray.aval"):
+      _ = x.aval
+    self.assertIsInstance(x, (int, jnp.ndarray))
+    self.assertTrue(jnp.ndarray.at.__doc__)
+
   def test_is_instance(self):
     def f(x):
       self.assertIsInstance(x, jnp.ndarray)
@@ -1350,6 +1391,17 @@ class APITest(jtu.JaxTestCase):
     jit(f)(3)
     jax.vmap(f)(np.arange(3))
 
+  def test_is_instance_non_array(self):
+    self.assertIs(isinstance(1., jnp.ndarray), False)
+    self.assertIs(isinstance(np.ones(3), jnp.ndarray), False)
+    self.assertIs(isinstance(object(), jnp.ndarray), False)
+
+  def test_is_instance_token_tracer(self):
+    def f(token):
+      self.assertNotIsInstance(token, jnp.ndarray)
+      return token
+    jit(f)(lax.create_token())
+
   def test_device_put_and_get(self):
     x = np.arange(12.).reshape((3, 4)).astype("float32")
     dx = api.device_put(x)